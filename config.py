@@ -12,7 +12,10 @@ DEFAULT_DEPTH_3D = 8
 
 # Maze generation settings
 MAZE_RANDOM_SEED = None  # Set to integer for reproducible mazes
-MAZE_RANDOM_PATHS_PERCENTAGE = 0.25  # Percentage of additional paths (0.0-1.0)
+MAZE_RANDOM_PATHS_PERCENTAGE = 0.25  # Probability of removing each interior wall (0.0-1.0)
+
+# Search settings
+HEURISTIC_WEIGHT = 1.0  # Weight w in f = g + w*h; >1 is faster, paths up to w times longer
 
 # Start and goal positions
 DEFAULT_START_2D = (0, 0)
@@ -24,7 +24,8 @@ Options:
     --mode {2d,3d}      Choose between 2D and 3D mode (default: 2d)
     --seed SEED         Random seed for maze generation
     --sample-maze       Use the sample maze instead of generating random
-    --random-paths PCT  Percentage of random paths to add (0.0-1.0)
+    --random-paths PCT  Probability of removing each interior wall (0.0-1.0)
+    --heuristic-weight W  Weight on the heuristic, f = g + W*h (default: 1.0)
 
 Author: Guglielmo Cimolai
 Date: 15/07/2025
@@ -32,9 +33,12 @@ Version: 5
 """
 
 import argparse
+import math
 import random
 import sys
 
+import numpy as np
+
 from src.core import AStar
 from src.maze import MazeGenerator
 from src.visualization import ConsoleVisualizer, MatplotlibVisualizer
@@ -104,14 +108,30 @@ def parse_arguments():
     )
     parser.add_argument(
         '--random-paths', type=float, default=config.MAZE_RANDOM_PATHS_PERCENTAGE,
-        help='Percentage of random paths to add (0.0-1.0)'
+        help='Probability of removing each interior wall (0.0-1.0)'
+    )
+    parser.add_argument(
+        '--heuristic-weight', type=float, default=config.HEURISTIC_WEIGHT,
+        help='Weight on the heuristic (>1 searches faster, paths at most that many times longer)'
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if not (math.isfinite(args.heuristic_weight) and args.heuristic_weight >= 0):
+        parser.error('--heuristic-weight must be a finite number >= 0')
+    return args
 
 
 def main():
     """Main entry point"""
+    from config import (
+        LEARNING_MODE, SHOW_PLOT,
+        DEFAULT_WIDTH, DEFAULT_HEIGHT,
+        DEFAULT_WIDTH_3D, DEFAULT_HEIGHT_3D, DEFAULT_DEPTH_3D,
+        ANIMATION_INTERVAL, ANIMATION_INTERVAL_3D,
+        LEARNING_MODE_INTERVAL, LEARNING_MODE_INTERVAL_3D,
+        DEFAULT_START_2D, DEFAULT_GOAL_2D, DEFAULT_START_3D, DEFAULT_GOAL_3D
+    )
+
     args = parse_arguments()
 
     # Determine learning mode setting
@@ -120,7 +140,7 @@ def main():
     elif args.no_learning_mode:
         learning_mode = False
     else:
-        learning_mode = config.LEARNING_MODE
+        learning_mode = LEARNING_MODE
 
     # Set random seed if provided
     if args.seed is not None:
@@ -130,13 +150,13 @@ def main():
     # Determine dimensions based on mode
     if args.mode == '3d':
         # Use 3D defaults if not specified
-        width = args.width if args.width else config.DEFAULT_WIDTH_3D
-        height = args.height if args.height else config.DEFAULT_HEIGHT_3D
-        depth = args.depth if args.depth else config.DEFAULT_DEPTH_3D
+        width = args.width if args.width else DEFAULT_WIDTH_3D
+        height = args.height if args.height else DEFAULT_HEIGHT_3D
+        depth = args.depth if args.depth else DEFAULT_DEPTH_3D
 
         # Set default interval for 3D if not specified
         if args.interval is None:
-            interval = config.LEARNING_MODE_INTERVAL_3D if learning_mode else config.ANIMATION_INTERVAL_3D
+            interval = LEARNING_MODE_INTERVAL_3D if learning_mode else ANIMATION_INTERVAL_3D
         else:
             interval = args.interval
     else:
@@ -152,8 +172,8 @@ def main():
                 print("Note: Using 21x21 maze for better learning mode visibility")
             else:
                 # Use specified or default dimensions
-                width = args.width if args.width else config.DEFAULT_WIDTH
-                height = args.height if args.height else config.DEFAULT_HEIGHT
+                width = args.width if args.width else DEFAULT_WIDTH
+                height = args.height if args.height else DEFAULT_HEIGHT
                 # Ensure odd dimensions for proper maze generation
                 width = width if width % 2 == 1 else width + 1
                 height = height if height % 2 == 1 else height + 1
@@ -162,7 +182,7 @@ def main():
 
         # Set default interval for 2D if not specified
         if args.interval is None:
-            interval = config.LEARNING_MODE_INTERVAL if learning_mode else config.ANIMATION_INTERVAL
+            interval = LEARNING_MODE_INTERVAL if learning_mode else ANIMATION_INTERVAL
         else:
             interval = args.interval
 
@@ -181,16 +201,16 @@ def main():
 
         # Add random paths if specified
         if args.random_paths > 0:
-            print(f"Adding random paths ({args.random_paths * 100:.1f}% of cells)...")
+            print(f"Adding random paths (removing {args.random_paths * 100:.1f}% of interior walls)...")
             maze_gen.add_random_paths(args.random_paths)
 
     # Define start and goal
     if args.mode == '3d':
-        start = config.DEFAULT_START_3D
-        goal = config.DEFAULT_GOAL_3D if config.DEFAULT_GOAL_3D else (depth - 1, height - 1, width - 1)
+        start = DEFAULT_START_3D
+        goal = DEFAULT_GOAL_3D if DEFAULT_GOAL_3D else (depth - 1, height - 1, width - 1)
     else:
-        start = config.DEFAULT_START_2D
-        goal = config.DEFAULT_GOAL_2D if config.DEFAULT_GOAL_2D else (height - 1, width - 1)
+        start = DEFAULT_START_2D
+        goal = DEFAULT_GOAL_2D if DEFAULT_GOAL_2D else (height - 1, width - 1)
 
     # Create pathfinder and find path with animation data
     print(f"\nFinding path with {'3D' if args.mode == '3d' else '2D'} A* algorithm...")
@@ -199,13 +219,24 @@ def main():
         if args.mode == '3d':
             print("Cost values shown: g/h format")
 
-    astar = AStar(grid)
-    path, animation_states, max_frontier, nodes_evaluated = astar.find_path_with_animation_data(start, goal)
+    # Array view of the maze, shared by the pathfinder and the statistics
+    grid_array = np.asarray(grid, dtype=np.uint8)
+
+    # Only the animated plot needs per-step states; everything else comes
+    # out of the same single search
+    show_plot = not args.no_plot and SHOW_PLOT and MatplotlibVisualizer.is_available()
+    animate = not (args.static and args.mode == '2d')
+
+    astar = AStar(grid_array, heuristic_weight=args.heuristic_weight)
+    result = astar.search(start, goal, collect_states=show_plot and animate)
+    path = result.path
+    max_frontier = result.max_frontier
+    nodes_evaluated = result.nodes_evaluated
 
     # Calculate statistics
     if path:
         path_length = len(path)
-        nodes_explored = len(animation_states)
+        nodes_explored = nodes_evaluated
         efficiency = (path_length / nodes_explored) * 100 if nodes_explored > 0 else 0
 
         print(f"Path found! Length: {path_length}")
@@ -216,16 +247,12 @@ def main():
     else:
         print("No path found!")
         path_length = 0
-        nodes_explored = len(animation_states)
+        nodes_explored = nodes_evaluated
         efficiency = 0
 
     # Show maze statistics
-    if args.mode == '3d':
-        total_cells = width * height * depth
-        walkable_cells = sum(sum(sum(1 for cell in row if cell == 0) for row in layer) for layer in grid)
-    else:
-        total_cells = width * height
-        walkable_cells = sum(row.count(0) for row in grid)
+    total_cells = grid_array.size
+    walkable_cells = int(np.count_nonzero(grid_array == 0))
 
     print(f"\nMaze statistics:")
     if args.mode == '3d':
@@ -245,7 +272,7 @@ def main():
         ConsoleVisualizer.visualize_path(grid, path, start, goal)
 
     # Matplotlib visualization
-    if not args.no_plot and config.SHOW_PLOT:
+    if not args.no_plot and SHOW_PLOT:
         if MatplotlibVisualizer.is_available():
             stats = {
                 'path_length': path_length,
@@ -255,12 +282,10 @@ def main():
                 'efficiency': efficiency
             }
 
-            if args.static and args.mode == '2d':
+            if not animate:
                 print("\nGenerating static visualization plot...")
-                # For static plot, need to get explored nodes list
-                _, explored_nodes, _, _ = astar.find_path_with_stats(start, goal)
                 MatplotlibVisualizer.plot_solution(
-                    grid, path, explored_nodes, start, goal, stats,
+                    grid, path, result.explored, start, goal, stats,
                     save_path=args.save_plot
                 )
             else:
@@ -273,7 +298,7 @@ def main():
                     print("Use mouse to rotate, zoom, and pan the view!")
 
                 MatplotlibVisualizer.plot_solution_animated(
-                    grid, path, animation_states, start, goal, stats,
+                    grid, path, result.animation_states, start, goal, stats,
                     interval=interval, learning_mode=learning_mode,
                     save_path=args.save_plot
                 )
@@ -0,0 +1,217 @@
+"""
+Numba-compiled A* search core used by AStar.find_path
+
+Importing this module requires numba. The kernels are compiled with
+cache=True, so the first call on a machine pays a one-off compile of a
+few seconds and later runs load the machine code from __pycache__.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _grow(array):
+    """Return a copy of array with twice the capacity"""
+    grown = np.empty(array.shape[0] * 2, array.dtype)
+    grown[:array.shape[0]] = array
+    return grown
+
+
+@njit(cache=True)
+def _before(key_a, seq_a, key_b, seq_b):
+    """Whether entry a pops before entry b: lower f, then the newer push"""
+    return key_a < key_b or (key_a == key_b and seq_a > seq_b)
+
+
+@njit(cache=True)
+def _sift_up(heap_key, heap_seq, heap_idx, pos):
+    """Move the entry at pos up until its parent pops before it"""
+    key = heap_key[pos]
+    seq = heap_seq[pos]
+    idx = heap_idx[pos]
+    while pos > 0:
+        parent = (pos - 1) >> 2
+        if not _before(key, seq, heap_key[parent], heap_seq[parent]):
+            break
+        heap_key[pos] = heap_key[parent]
+        heap_seq[pos] = heap_seq[parent]
+        heap_idx[pos] = heap_idx[parent]
+        pos = parent
+    heap_key[pos] = key
+    heap_seq[pos] = seq
+    heap_idx[pos] = idx
+
+
+@njit(cache=True)
+def _sift_down(heap_key, heap_seq, heap_idx, size):
+    """Move the root entry down until it pops before all of its children"""
+    key = heap_key[0]
+    seq = heap_seq[0]
+    idx = heap_idx[0]
+    pos = 0
+    while True:
+        first = 4 * pos + 1
+        if first >= size:
+            break
+
+        # Pick the first to pop of up to four children
+        child = first
+        last = min(first + 4, size)
+        for other in range(first + 1, last):
+            if _before(heap_key[other], heap_seq[other], heap_key[child], heap_seq[child]):
+                child = other
+        if not _before(heap_key[child], heap_seq[child], key, seq):
+            break
+        heap_key[pos] = heap_key[child]
+        heap_seq[pos] = heap_seq[child]
+        heap_idx[pos] = heap_idx[child]
+        pos = child
+    heap_key[pos] = key
+    heap_seq[pos] = seq
+    heap_idx[pos] = idx
+
+
+@njit(cache=True)
+def astar_core(walkable, shape, start_idx, goal_idx, weight):
+    """
+    Run A* on a flattened 2D or 3D grid
+    walkable: flat uint8 array where 1 = walkable, 0 = obstacle
+    shape: int64 array with the grid dimensions
+    weight: heuristic weight w, cells are ordered by f = g + w * h
+    Returns: (path_array, explored_array, nodes_evaluated, max_frontier_size)
+    where path_array holds the flat cell indices from start to goal (empty
+    if no path exists) and explored_array the cells closed, in order
+    """
+    ndim = shape.shape[0]
+    n = walkable.shape[0]
+
+    # Row-major strides and goal coordinates
+    strides = np.empty(ndim, np.int64)
+    stride = 1
+    for axis in range(ndim - 1, -1, -1):
+        strides[axis] = stride
+        stride *= shape[axis]
+    goal = np.empty(ndim, np.int64)
+    coords = np.empty(ndim, np.int64)
+    rem = goal_idx
+    for axis in range(ndim):
+        goal[axis] = rem // strides[axis]
+        rem -= goal[axis] * strides[axis]
+
+    g = np.full(n, np.inf, np.float32)
+    parent = np.full(n, -1, np.int32)
+    closed = np.zeros(n, np.bool_)
+    explored = np.empty(n, np.int64)  # Closed cells in closing order
+    num_explored = 0
+
+    # Neighbor steps as (axis, step) in the order AStar.get_neighbors
+    # yields them, so equal-f ties resolve exactly as in the Python searches
+    if ndim == 2:
+        dir_axis = np.array((1, 0, 1, 0))
+        dir_step = np.array((1, 1, -1, -1))
+    else:
+        dir_axis = np.array((0, 0, 1, 1, 2, 2))
+        dir_step = np.array((1, -1, 1, -1, 1, -1))
+
+    # 4-ary heap stored as parallel arrays of f keys, push sequence numbers
+    # and cell indices; the children of entry i are 4i+1..4i+4, halving the
+    # tree depth. Entries pop by f, and the newest push first among equal f
+    # like the tiebreak counter of the Python heaps
+    heap_key = np.empty(64, np.float64)
+    heap_seq = np.empty(64, np.int64)
+    heap_idx = np.empty(64, np.int32)
+
+    g[start_idx] = 0
+    heap_key[0] = 0
+    heap_seq[0] = 0
+    heap_idx[0] = start_idx
+    size = 1
+    pushes = 1
+
+    nodes_evaluated = 0
+    frontier_size = 1  # Cells reached but not yet closed
+    max_frontier_size = 1
+    found = False
+
+    while size > 0:
+        # Pop the entry with lowest key
+        idx = heap_idx[0]
+        size -= 1
+        if size > 0:
+            heap_key[0] = heap_key[size]
+            heap_seq[0] = heap_seq[size]
+            heap_idx[0] = heap_idx[size]
+            _sift_down(heap_key, heap_seq, heap_idx, size)
+
+        # Skip entries superseded by a cheaper push
+        if closed[idx]:
+            continue
+        nodes_evaluated += 1
+        frontier_size -= 1
+
+        if idx == goal_idx:
+            found = True
+            break
+
+        closed[idx] = True
+        explored[num_explored] = idx
+        num_explored += 1
+
+        rem = idx
+        current_h = 0
+        for axis in range(ndim):
+            coords[axis] = rem // strides[axis]
+            rem -= coords[axis] * strides[axis]
+            current_h += abs(coords[axis] - goal[axis])
+        tentative_g = g[idx] + 1  # Cost to move to neighbor is 1
+
+        # Step one cell along each neighbor direction
+        for d in range(dir_axis.shape[0]):
+            axis = dir_axis[d]
+            step = dir_step[d]
+            c = coords[axis]
+            nc = c + step
+            if nc < 0 or nc >= shape[axis]:
+                continue
+            nidx = idx + step * strides[axis]
+            if closed[nidx] or not walkable[nidx]:
+                continue
+
+            if tentative_g < g[nidx]:
+                if g[nidx] == np.inf:
+                    frontier_size += 1
+                g[nidx] = tentative_g
+                parent[nidx] = idx
+                h = current_h - abs(c - goal[axis]) + abs(nc - goal[axis])
+
+                if size == heap_key.shape[0]:
+                    heap_key = _grow(heap_key)
+                    heap_seq = _grow(heap_seq)
+                    heap_idx = _grow(heap_idx)
+                heap_key[size] = tentative_g + weight * h
+                heap_seq[size] = pushes
+                heap_idx[size] = nidx
+                _sift_up(heap_key, heap_seq, heap_idx, size)
+                size += 1
+                pushes += 1
+
+        if frontier_size > max_frontier_size:
+            max_frontier_size = frontier_size
+
+    explored = explored[:num_explored]
+    if not found:
+        return np.empty(0, np.int64), explored, nodes_evaluated, max_frontier_size
+
+    # Walk the parent chain back from the goal
+    length = 0
+    idx = goal_idx
+    while idx != -1:
+        length += 1
+        idx = parent[idx]
+    path = np.empty(length, np.int64)
+    idx = goal_idx
+    for i in range(length - 1, -1, -1):
+        path[i] = idx
+        idx = parent[idx]
+    return path, explored, nodes_evaluated, max_frontier_size
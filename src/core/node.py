@@ -1,12 +1,50 @@
 """Node representation for pathfinding algorithms"""
 
+from __future__ import annotations
+
+import itertools
+import operator
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import List, Tuple, Dict, Optional
 
+# Nodes hash by their coordinates packed into one integer, with this many
+# bits per axis and a flag on 3D keys. Equality still compares the
+# coordinates themselves, so coordinates outside 0..2**21-1 whose keys
+# collide only cost a hash collision, never a false match
+_COORD_BITS = 21
+_3D_FLAG = 1 << (3 * _COORD_BITS)
+
+
+def _coord_key(coords):
+    """
+    Hash key for a 2D or 3D coordinate tuple
+    Integer coordinates, including NumPy integers, are packed into one
+    plain int; integral floats pack like the ints they equal, so equal
+    nodes always hash alike, and any other values hash as the tuple
+    """
+    try:
+        ints = [operator.index(c) for c in coords]
+    except TypeError:
+        try:
+            ints = [int(c) for c in coords]
+        except (TypeError, ValueError, OverflowError):
+            return hash(coords)
+        if any(i != c for i, c in zip(ints, coords)):
+            return hash(coords)
+
+    if len(ints) == 2:
+        x, y = ints
+        return x << _COORD_BITS | y
+    x, y, z = ints
+    return _3D_FLAG | (x << _COORD_BITS | y) << _COORD_BITS | z
+
 
 class Node:
     """Represents a cell in the grid"""
 
+    __slots__ = ('x', 'y', 'z', '_key', 'g', 'h', 'f', 'parent')
+
     def __init__(self, *coords):
         """
         Initialize a node with coordinates.
@@ -15,31 +53,104 @@ class Node:
         if len(coords) == 2:
             self.x, self.y = coords
             self.z = None
-            self.coords = (self.x, self.y)
         elif len(coords) == 3:
             self.x, self.y, self.z = coords
-            self.coords = (self.x, self.y, self.z)
         else:
             raise ValueError("Node requires 2 or 3 coordinates")
+        self._key = _coord_key(coords)
 
         self.g = float('inf')  # Cost from start to this node
         self.h = 0  # Heuristic cost from this node to goal
         self.f = float('inf')  # Total cost (g + h)
         self.parent = None
 
-    def __lt__(self, other):
-        return self.f < other.f
+    @property
+    def coords(self):
+        """Coordinates as a tuple, (x, y) or (x, y, z)"""
+        if self.z is None:
+            return (self.x, self.y)
+        return (self.x, self.y, self.z)
 
     def __eq__(self, other):
-        return self.coords == other.coords
+        return self.x == other.x and self.y == other.y and self.z == other.z
 
     def __hash__(self):
-        return hash(self.coords)
+        return self._key
+
+
+class PrefixView(Sequence):
+    """
+    Read-only view of the first `length` items of a list
+
+    Lets every animation step share one growing list of explored cells
+    instead of holding its own copy, which would cost O(steps^2) memory.
+    Items appended to the list later are not visible through the view.
+    """
+
+    __slots__ = ('_items', '_length')
+
+    def __init__(self, items, length):
+        self._items = items
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._items[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("PrefixView index out of range")
+        return self._items[index]
+
+    def __iter__(self):
+        return itertools.islice(self._items, self._length)
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, tuple, PrefixView)):
+            return NotImplemented
+        return len(other) == self._length and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        return repr(list(self))
 
 
 @dataclass
 class AlgorithmState:
-    """Captures the state of the algorithm at a specific step"""
-    explored_nodes: List[Tuple[int, ...]]
-    frontier: Dict[Tuple[int, ...], Tuple[float, float, float]]  # coords -> (g, h, f)
+    """
+    Captures the state of the algorithm at a specific step
+
+    The frontier is stored as the change since the previous state, so a
+    long search does not hold a full copy per step; replay_frontier
+    rebuilds the complete frontier of each step.
+    """
+    explored_nodes: Sequence[Tuple[int, ...]]  # list or PrefixView
+    frontier_added: Dict[Tuple[int, ...], Tuple[float, float, float]]  # coords -> (g, h, f)
+    frontier_removed: List[Tuple[int, ...]]  # Cells closed since the previous state
     current_node: Optional[Tuple[int, ...]] = None
+
+
+def replay_frontier(states):
+    """
+    Yield the full frontier (coords -> (g, h, f)) at each of the states
+    The same dict is updated in place and yielded every step, so copy it
+    to keep a snapshot.
+    """
+    frontier = {}
+    for state in states:
+        for coords in state.frontier_removed:
+            frontier.pop(coords, None)
+        frontier.update(state.frontier_added)
+        yield frontier
+
+
+@dataclass
+class SearchResult:
+    """Everything a single A* run produces"""
+    path: Optional[List[Tuple[int, ...]]]  # None if no path exists
+    explored: List[Tuple[int, ...]]  # Closed cells in closing order
+    animation_states: List[AlgorithmState]  # Empty unless states were collected
+    max_frontier: int
+    nodes_evaluated: int
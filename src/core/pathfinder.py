@@ -1,96 +1,683 @@
 """A* pathfinding algorithm implementation"""
 
 import heapq
+import importlib.util
+import itertools
+import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from typing import List, Tuple, Optional, Dict
-from .node import Node, AlgorithmState
+
+import numpy as np
+
+from .node import AlgorithmState, PrefixView, SearchResult
+
+# numba is optional; the compiled search core is only imported (and on a
+# cold cache, compiled) the first time find_path runs, so callers that only
+# use the animated search never pay for loading it
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+
+def _numba_core():
+    """
+    Import the compiled search core on first use
+    Returns: astar_core, or None when numba is missing or fails to import
+    (e.g. it does not support the installed NumPy), in which case the
+    pure Python search is used from then on
+    """
+    global NUMBA_AVAILABLE
+    if NUMBA_AVAILABLE:
+        try:
+            from ._astar_numba import astar_core
+            return astar_core
+        except ImportError:
+            NUMBA_AVAILABLE = False
+    return None
+
+# Bit flags for the per-cell state arrays of the searches
+_CLOSED = 1  # Cell has been evaluated
+_IN_OPEN = 2  # Cell has a live entry in the open set
+_WALL = 4  # Cell is an obstacle, preset before the search starts
+_BLOCKED = _CLOSED | _WALL  # Neighbors with either bit set are skipped
+
+# 4-directional movement for 2D
+_DIRS_2D = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+# 6-directional movement for 3D
+_DIRS_3D = (
+    (1, 0, 0), (-1, 0, 0),  # x-axis
+    (0, 1, 0), (0, -1, 0),  # y-axis
+    (0, 0, 1), (0, 0, -1)  # z-axis
+)
+
+
+def _manhattan(x1, y1, x2, y2):
+    """Manhattan distance between two 2D cells"""
+    return abs(x1 - x2) + abs(y1 - y2)
+
+
+def _manhattan_3d(x1, y1, z1, x2, y2, z2):
+    """Manhattan distance between two 3D cells"""
+    return abs(x1 - x2) + abs(y1 - y2) + abs(z1 - z2)
+
+
+def _bucket_queue():
+    """
+    Monotone bucket queue for integer priorities
+    Returns: (push, pop) where pop returns -1 once the queue is empty
+
+    With unit costs and a consistent heuristic popped f values never
+    decrease, so buckets[f] holds the cells pushed with that f and the
+    current_f pointer only moves forward. Equal-f cells pop newest first.
+    """
+    buckets = []
+    current_f = 0
+
+    def push(f, idx):
+        while len(buckets) <= f:
+            buckets.append([])
+        buckets[f].append(idx)
+
+    def pop():
+        nonlocal current_f
+        while current_f < len(buckets):
+            bucket = buckets[current_f]
+            if bucket:
+                return bucket.pop()
+            current_f += 1
+        return -1
+
+    return push, pop
+
+
+def _heap_queue():
+    """
+    Binary heap priority queue for arbitrary priorities
+    Returns: (push, pop) where pop returns -1 once the queue is empty
+    """
+    heap = []
+    tiebreak = itertools.count(0, -1)
+
+    def push(f, idx):
+        heapq.heappush(heap, (f, next(tiebreak), idx))
+
+    def pop():
+        return heapq.heappop(heap)[2] if heap else -1
+
+    return push, pop
+
+
+# Per-process state of find_paths_batch workers, set up by _init_batch_worker
+_worker_shm = None
+_worker_astar = None
+
+
+def _init_batch_worker(shm_name, shape, heuristic_weight):
+    """Attach a batch worker to the shared grid and build its pathfinder once"""
+    global _worker_shm, _worker_astar
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    grid = np.ndarray(shape, dtype=np.uint8, buffer=_worker_shm.buf)
+    _worker_astar = AStar(grid, heuristic_weight=heuristic_weight)
+
+
+def _batch_find_path(query):
+    """Solve one (start, goal) query in a batch worker"""
+    start, goal = query
+    return _worker_astar.find_path(start, goal)
 
 
 class AStar:
     """A* pathfinding algorithm for 2D and 3D grids"""
 
-    def __init__(self, grid):
+    def __init__(self, grid, heuristic_weight=1.0):
         """
         Initialize A* pathfinder
-        grid: 2D or 3D list where 0 = walkable, 1 = obstacle
+        grid: 2D or 3D list (or array) where 0 = walkable, 1 = obstacle
+        heuristic_weight: factor w applied to the heuristic, f = g + w * h;
+            a finite number >= 0, anything else raises ValueError
+
+        With w = 1 paths are optimal. A larger w makes the search greedier,
+        expanding far fewer cells on big mazes, and any path it returns is
+        at most w times longer than the shortest one. find_path_bidirectional
+        always searches with w = 1.
         """
-        self.grid = grid
+        # NaN or inf would turn f values into NaN and break the ordering
+        if not (math.isfinite(heuristic_weight) and heuristic_weight >= 0):
+            raise ValueError("heuristic_weight must be a finite number >= 0")
+        self.heuristic_weight = heuristic_weight
+        self.grid = np.ascontiguousarray(grid, dtype=np.uint8)
+        # Flat walkability mask (1 = walkable) for single-index neighbor checks
+        self.walkable = (self.grid == 0).tobytes()
+        # Initial per-cell search state with the _WALL bit already set, so
+        # one byte test rejects both obstacles and closed cells
+        self._wall_state = ((self.grid != 0) * _WALL).astype(np.uint8).tobytes()
         self._determine_dimensions()
 
     def _determine_dimensions(self):
         """Determine if grid is 2D or 3D and set dimensions"""
-        if isinstance(self.grid[0][0], list):
+        if self.grid.ndim == 3:
             # 3D grid
             self.is_3d = True
-            self.depth = len(self.grid)
-            self.rows = len(self.grid[0]) if self.depth > 0 else 0
-            self.cols = len(self.grid[0][0]) if self.rows > 0 else 0
+            self.depth, self.rows, self.cols = self.grid.shape
+            self._plane = self.rows * self.cols  # Cells per x-layer
+            self._strides = (self._plane, self.cols, 1)
+            self._heuristic = _manhattan_3d
         else:
             # 2D grid
             self.is_3d = False
-            self.rows = len(self.grid)
-            self.cols = len(self.grid[0]) if self.rows > 0 else 0
+            self.rows, self.cols = self.grid.shape
             self.depth = None
+            self._plane = None
+            self._strides = (self.cols, 1)
+            self._heuristic = _manhattan
+
+        # Total number of cells, used to size the flat search arrays
+        self.N = self.grid.size
+
+        # Every move costs 1, so unweighted f-scores are integers and
+        # find_path can use a bucket queue instead of a binary heap
+        self._unit_cost = True
 
-    def heuristic(self, node1, node2):
-        """Calculate heuristic distance (Manhattan distance)"""
+    def _to_index(self, coords):
+        """Convert (x, y) or (x, y, z) coordinates to a flat cell index"""
         if self.is_3d:
-            return abs(node1.x - node2.x) + abs(node1.y - node2.y) + abs(node1.z - node2.z)
-        else:
-            return abs(node1.x - node2.x) + abs(node1.y - node2.y)
+            x, y, z = coords
+            return x * self._plane + y * self.cols + z
+        x, y = coords
+        return x * self.cols + y
 
-    def get_neighbors(self, node):
-        """Get valid neighboring nodes"""
-        neighbors = []
+    def _to_coords(self, idx):
+        """Convert a flat cell index back to (x, y) or (x, y, z) coordinates"""
+        if self.is_3d:
+            x, rem = divmod(idx, self._plane)
+            y, z = divmod(rem, self.cols)
+            return x, y, z
+        return divmod(idx, self.cols)
 
+    def _heuristic_array(self, goal):
+        """
+        Manhattan distance from every cell to goal
+        Returns: flat array('i') indexed by cell, so each lookup is one load
+        """
+        h = np.zeros(self.grid.shape, np.intc)
+        for axis, (size, target) in enumerate(zip(self.grid.shape, goal)):
+            # Distances along one axis, broadcast over the others
+            axis_shape = [1] * self.grid.ndim
+            axis_shape[axis] = size
+            h += np.abs(np.arange(size, dtype=np.intc) - target).reshape(axis_shape)
+        return array('i', h.tobytes())
+
+    def get_neighbors(self, coords):
+        """Yield the coordinates of valid neighboring cells"""
         if self.is_3d:
-            # 6-directional movement for 3D
-            directions = [
-                (1, 0, 0), (-1, 0, 0),  # x-axis
-                (0, 1, 0), (0, -1, 0),  # y-axis
-                (0, 0, 1), (0, 0, -1)  # z-axis
-            ]
-
-            for dx, dy, dz in directions:
-                nx, ny, nz = node.x + dx, node.y + dy, node.z + dz
-
-                if (0 <= nx < self.depth and
-                        0 <= ny < self.rows and
-                        0 <= nz < self.cols and
-                        self.grid[nx][ny][nz] == 0):
-                    neighbors.append(Node(nx, ny, nz))
+            x, y, z = coords
+            for dx, dy, dz in _DIRS_3D:
+                nx, ny, nz = x + dx, y + dy, z + dz
+                if (0 <= nx < self.depth and 0 <= ny < self.rows and 0 <= nz < self.cols
+                        and self.walkable[nx * self._plane + ny * self.cols + nz]):
+                    yield nx, ny, nz
         else:
-            # 4-directional movement for 2D
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+            x, y = coords
+            for dx, dy in _DIRS_2D:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < self.rows and 0 <= ny < self.cols and self.walkable[nx * self.cols + ny]:
+                    yield nx, ny
+
+    def reconstruct_path(self, parent, idx):
+        """Reconstruct path from start to goal by walking the parent array"""
+        # Count the steps first so the path can be filled in place, back to front
+        length = 0
+        current = idx
+        while current != -1:
+            length += 1
+            current = parent[current]
+
+        path = [None] * length
+        for i in range(length - 1, -1, -1):
+            path[i] = tuple(int(c) for c in self._to_coords(idx))
+            idx = parent[idx]
+        return path
 
-            for dx, dy in directions:
-                nx, ny = node.x + dx, node.y + dy
+    def find_path(self, start, goal):
+        """
+        Find shortest path from start to goal using A*
+        start: tuple (x, y) or (x, y, z)
+        goal: tuple (x, y) or (x, y, z)
+        Returns: list of tuples representing the path
+        """
+        # Check if start and goal are valid
+        if self.grid[start] == 1 or self.grid[goal] == 1:
+            return None
 
-                if (0 <= nx < self.rows and
-                        0 <= ny < self.cols and
-                        self.grid[nx][ny] == 0):
-                    neighbors.append(Node(nx, ny))
+        start_idx = self._to_index(start)
+        goal_idx = self._to_index(goal)
 
-        return neighbors
+        # Use the compiled search core when numba is installed
+        if _numba_core() is not None:
+            path_idx, _, _, _ = self._find_path_numba(start_idx, goal_idx)
+            return [self._to_coords(idx) for idx in path_idx.tolist()] or None
 
-    def reconstruct_path(self, node):
-        """Reconstruct path from start to goal"""
-        path = []
-        current = node
-        while current:
-            path.append(current.coords)
-            current = current.parent
-        return path[::-1]  # Reverse to get path from start to goal
+        path, _, _, _ = self._search_core(start_idx, goal_idx, goal)
+        return path
 
-    def find_path(self, start, goal):
+    def _find_path_numba(self, start_idx, goal_idx):
         """
-        Find shortest path from start to goal using A*
+        Run the compiled search core
+        Returns: (path_idx, explored_idx, nodes_evaluated, max_frontier_size)
+        with the path and explored cells as arrays of flat indices
+        """
+        astar_core = _numba_core()
+
+        walkable = np.frombuffer(self.walkable, np.uint8)
+        return astar_core(walkable, np.array(self.grid.shape, np.int64), start_idx, goal_idx,
+                          float(self.heuristic_weight))
+
+    def _search_core(self, start_idx, goal_idx, goal):
+        """
+        Pure Python search loop shared by find_path and find_path_with_stats
+        Returns: (path, explored_idx, nodes_evaluated, max_frontier_size)
+        with the explored cells as a list of flat indices in closing order
+
+        Unlike find_path_with_animation_data nothing is snapshotted per
+        step, so each expansion only costs its own neighbour checks.
+        """
+        is_3d = self.is_3d
+        depth, rows, cols, plane = self.depth, self.rows, self.cols, self._plane
+
+        # Search state stored as flat typed arrays indexed by cell, so every
+        # read is a plain Python number rather than a boxed NumPy scalar
+        inf = float('inf')
+        g = array('f', [inf]) * self.N  # Cost from start
+        parent = array('i', [-1]) * self.N  # Previous cell on best path
+        closed = bytearray(self._wall_state)  # _CLOSED / _WALL flags
+        h = self._heuristic_array(goal)  # Heuristic cost to goal
+
+        explored = []  # Closed cells in closing order
+
+        g[start_idx] = 0
+        start_h = h[start_idx]
+
+        # The bucket queue needs integer f values that never decrease when
+        # popped, which a weighted heuristic breaks
+        weight = self.heuristic_weight
+        integer_f = self._unit_cost and weight == 1
+        push, pop = _bucket_queue() if integer_f else _heap_queue()
+        push(start_h if integer_f else start_h * weight, start_idx)
+
+        # Statistics
+        nodes_evaluated = 0
+        frontier_size = 1  # Cells reached but not yet closed
+        max_frontier_size = 1
+
+        while True:
+            idx = pop()
+            if idx < 0:
+                break
+
+            # Skip entries superseded by a cheaper push
+            if closed[idx]:
+                continue
+            nodes_evaluated += 1
+            frontier_size -= 1
+
+            if idx == goal_idx:
+                path = self.reconstruct_path(parent, idx)
+                return path, explored, nodes_evaluated, max_frontier_size
+
+            closed[idx] = _CLOSED
+            explored.append(idx)
+            tentative_g = g[idx] + 1  # Cost to move to neighbor is 1
+
+            # Probe the neighbors inline as (index, in bounds), in the same
+            # order get_neighbors yields them; with the newest-first queues
+            # this fixes how equal-f ties resolve, matching the other searches
+            if is_3d:
+                x, y, z = self._to_coords(idx)
+                probes = ((idx + plane, x < depth - 1), (idx - plane, x > 0),
+                          (idx + cols, y < rows - 1), (idx - cols, y > 0),
+                          (idx + 1, z < cols - 1), (idx - 1, z > 0))
+            else:
+                x, y = divmod(idx, cols)
+                probes = ((idx + 1, y < cols - 1), (idx + cols, x < rows - 1),
+                          (idx - 1, y > 0), (idx - cols, x > 0))
+
+            for nidx, in_bounds in probes:
+                if not in_bounds or closed[nidx]:
+                    continue
+
+                if tentative_g < g[nidx]:
+                    if g[nidx] == inf:
+                        frontier_size += 1
+                    g[nidx] = tentative_g
+                    parent[nidx] = idx
+
+                    if integer_f:
+                        push(int(tentative_g) + h[nidx], nidx)
+                    else:
+                        push(tentative_g + weight * h[nidx], nidx)
+
+            if frontier_size > max_frontier_size:
+                max_frontier_size = frontier_size
+
+        return None, explored, nodes_evaluated, max_frontier_size
+
+    def find_paths_batch(self, queries, max_workers=None):
+        """
+        Find shortest paths for many independent queries on this grid
+        queries: list of (start, goal) tuples
+        max_workers: number of worker processes (default: one per CPU)
+        Returns: list of paths (or None) in the same order as queries
+
+        The grid is placed in shared memory once and every worker process
+        attaches to it and builds its own AStar, then runs find_path (the
+        compiled core when numba is installed) for its share of queries.
+        Searches run fully in parallel since they share nothing mutable.
+        Starting the workers costs far more than one search on a small
+        grid, so this only pays off for large batches or large grids;
+        with max_workers=1 the queries are solved serially in-process.
+        """
+        queries = [(tuple(start), tuple(goal)) for start, goal in queries]
+        if max_workers == 1 or len(queries) <= 1:
+            return [self.find_path(start, goal) for start, goal in queries]
+
+        shm = shared_memory.SharedMemory(create=True, size=self.grid.nbytes)
+        try:
+            np.ndarray(self.grid.shape, dtype=np.uint8, buffer=shm.buf)[...] = self.grid
+            with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_batch_worker,
+                    initargs=(shm.name, self.grid.shape, self.heuristic_weight)) as executor:
+                # Hand out queries in chunks to keep the IPC overhead low
+                workers = max_workers or os.cpu_count() or 1
+                chunksize = max(1, len(queries) // (workers * 4))
+                return list(executor.map(_batch_find_path, queries, chunksize=chunksize))
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def find_path_bidirectional(self, start, goal):
+        """
+        Find shortest path from start to goal using bidirectional A*
         start: tuple (x, y) or (x, y, z)
         goal: tuple (x, y) or (x, y, z)
         Returns: list of tuples representing the path
+
+        A forward search from start (heuristic towards goal) and a backward
+        search from goal (heuristic towards start) expand one cell in turn.
+        Whenever one search reaches a cell the other has already reached,
+        the joined cost is a candidate; the search stops once the lowest f
+        in either frontier can no longer beat the best candidate, so the
+        path is still optimal.
+
+        On open grids each frontier only has to cover about half the
+        distance, which can roughly halve the number of expanded cells.
+        In corridor mazes with a single route the frontiers stay narrow,
+        there is little to save, and each expansion pays for two searches'
+        bookkeeping, so find_path remains the default.
         """
-        path, _, _, _ = self.find_path_with_stats(start, goal)
+        # Check if start and goal are valid
+        if self.grid[start] == 1 or self.grid[goal] == 1:
+            return None
+
+        start_idx = self._to_index(start)
+        goal_idx = self._to_index(goal)
+        if start_idx == goal_idx:
+            return [self._to_coords(start_idx)]
+
+        heuristic = self._heuristic
+        shape = self.grid.shape
+        inf = float('inf')
+
+        # Index 0 holds the forward search, index 1 the backward search
+        targets = (goal, start)
+        g = ([inf] * self.N, [inf] * self.N)
+        parent = ([-1] * self.N, [-1] * self.N)
+        closed = (bytearray(self._wall_state), bytearray(self._wall_state))  # _CLOSED / _WALL flags
+        # Heap entries are (f, tiebreak, idx), newest first among equal f
+        tiebreak = itertools.count(0, -1)
+        open_sets = ([(heuristic(*start, *goal), next(tiebreak), start_idx)],
+                     [(heuristic(*goal, *start), next(tiebreak), goal_idx)])
+        g[0][start_idx] = 0
+        g[1][goal_idx] = 0
+
+        best_cost = inf  # Cheapest start-to-goal cost found so far
+        meet_idx = -1  # Cell where the two halves of that path join
+        side = 0
+
+        while open_sets[0] and open_sets[1]:
+            # Neither frontier can improve on the best meeting any more
+            if max(open_sets[0][0][0], open_sets[1][0][0]) >= best_cost:
+                break
+
+            open_set, g_side, g_other = open_sets[side], g[side], g[1 - side]
+            parent_side, closed_side = parent[side], closed[side]
+            target = targets[side]
+
+            _, _, idx = heapq.heappop(open_set)
+            if not closed_side[idx]:
+                closed_side[idx] = _CLOSED
+                coords = self._to_coords(idx)
+                current_h = heuristic(*coords, *target)
+                tentative_g = g_side[idx] + 1  # Cost to move to neighbor is 1
+
+                # Step one cell forwards and backwards along each axis
+                for axis, stride in enumerate(self._strides):
+                    c = coords[axis]
+                    for nidx, nc, in_bounds in ((idx + stride, c + 1, c < shape[axis] - 1),
+                                                (idx - stride, c - 1, c > 0)):
+                        if not in_bounds or closed_side[nidx] or tentative_g >= g_side[nidx]:
+                            continue
+
+                        g_side[nidx] = tentative_g
+                        parent_side[nidx] = idx
+                        h = current_h - abs(c - target[axis]) + abs(nc - target[axis])
+                        heapq.heappush(open_set, (tentative_g + h, next(tiebreak), nidx))
+
+                        # A cell reached by both searches joins the two halves
+                        if tentative_g + g_other[nidx] < best_cost:
+                            best_cost = tentative_g + g_other[nidx]
+                            meet_idx = nidx
+
+            side = 1 - side
+
+        if meet_idx == -1:
+            return None
+
+        # Forward half runs start -> meet, backward half continues to goal
+        path = self.reconstruct_path(parent[0], meet_idx)
+        idx = parent[1][meet_idx]
+        while idx != -1:
+            path.append(self._to_coords(idx))
+            idx = parent[1][idx]
         return path
 
+    def find_path_jps(self, start, goal):
+        """
+        Find shortest path from start to goal using Jump Point Search
+        start: tuple (x, y)
+        goal: tuple (x, y)
+        Returns: list of tuples representing the path
+
+        Instead of pushing every neighbor, each expansion walks straight in
+        each direction (except back towards its parent) and only pushes
+        the cell where the walk has to stop: the goal, or a jump point
+        where a side opening appears that the cell behind it lacked.
+        Walks along x also probe sideways along y at every step, so turns
+        into side corridors are never missed. Mazes with long corridors
+        collapse into a few expansions while paths stay optimal; on wide
+        open grids the sideways probes scan most cells, and find_path is
+        faster there.
+
+        JPS as implemented here is 2D only; 3D grids fall back to find_path.
+        The heuristic is never weighted.
+        """
+        if self.is_3d:
+            return self.find_path(start, goal)
+
+        # Check if start and goal are valid
+        if self.grid[start] == 1 or self.grid[goal] == 1:
+            return None
+
+        # Cells are addressed in a copy of the walkability mask padded with
+        # a ring of walls, so walks never need bounds checks. The indices are
+        # plain ints even for NumPy integer coordinates, so cell arithmetic
+        # and direction signs never turn into NumPy scalars and booleans
+        width = self.cols + 2
+        padded = np.pad(self.grid == 0, 1).tobytes()
+        start_p = int((start[0] + 1) * width + start[1] + 1)
+        goal_p = int((goal[0] + 1) * width + goal[1] + 1)
+
+        g = {start_p: 0}
+        parent = {start_p: -1}  # Previous jump point on best path
+        closed = set()
+        y_cache = ({}, {})  # Memoized walks along -y and +y, see _jump_y
+        # Edges between jump points are straight runs of varying length, so
+        # a general heap is used rather than the unit-cost bucket queue
+        tiebreak = itertools.count(0, -1)
+        open_set = [(_manhattan(*start, *goal), next(tiebreak), start_p)]
+        goal_x, goal_y = divmod(goal_p, width)
+        steps = (1, width, -1, -width)  # Same order as _DIRS_2D
+
+        while open_set:
+            _, _, p = heapq.heappop(open_set)
+            if p in closed:
+                continue
+
+            if p == goal_p:
+                return self._expand_jump_path(parent, p, width)
+
+            closed.add(p)
+            x, y = divmod(p, width)
+            back = 0
+            if parent[p] != -1:
+                # Never walk straight back towards the parent
+                px, py = divmod(parent[p], width)
+                back = width * ((px > x) - (px < x)) + (py > y) - (py < y)
+
+            for step in steps:
+                if step == back:
+                    continue
+                if step in (1, -1):
+                    jp = self._jump_y(padded, width, p, step, goal_p, y_cache)
+                else:
+                    jp = self._jump_x(padded, width, p, step, goal_p, y_cache)
+                if jp is None or jp in closed:
+                    continue
+
+                jx, jy = divmod(jp, width)
+                tentative_g = g[p] + abs(jx - x) + abs(jy - y)
+                if tentative_g < g.get(jp, float('inf')):
+                    g[jp] = tentative_g
+                    parent[jp] = p
+                    f = tentative_g + abs(jx - goal_x) + abs(jy - goal_y)
+                    heapq.heappush(open_set, (f, next(tiebreak), jp))
+
+        return None
+
+    def _jump_x(self, padded, width, p, step, goal_p, y_cache):
+        """
+        Walk from padded cell p along x (step = +-width) to a jump point
+        Returns: the jump point's padded index, or None if a wall comes first
+        """
+        while True:
+            p += step
+            if not padded[p]:
+                return None
+            if p == goal_p:
+                return p
+
+            # A side cell that opens up where the previous cell had a wall
+            # can only be reached optimally through this cell
+            if ((padded[p - 1] and not padded[p - step - 1])
+                    or (padded[p + 1] and not padded[p - step + 1])):
+                return p
+            # Walks along x must not step past a jump point along y
+            if (self._jump_y(padded, width, p, 1, goal_p, y_cache) is not None
+                    or self._jump_y(padded, width, p, -1, goal_p, y_cache) is not None):
+                return p
+
+    @staticmethod
+    def _jump_y(padded, width, p, step, goal_p, y_cache):
+        """
+        Walk from padded cell p along y (step = +-1) to a jump point
+        y_cache: pair of dicts for -y and +y walks, start cell -> result
+        Returns: the jump point's padded index, or None if a wall comes first
+
+        Every walk along x probes sideways at each step, so the same runs
+        get probed over and over. Each cell a walk passes through would
+        stop at the same place, so they all share its cached result.
+        """
+        cache = y_cache[step > 0]
+        if p in cache:
+            return cache[p]
+
+        passed = [p]
+        result = None
+        while True:
+            p += step
+            if not padded[p]:
+                break
+            if (p == goal_p
+                    or (padded[p - width] and not padded[p - width - step])
+                    or (padded[p + width] and not padded[p + width - step])):
+                result = p
+                break
+            if p in cache:
+                result = cache[p]
+                break
+            passed.append(p)
+
+        for cell in passed:
+            cache[cell] = result
+        return result
+
+    @staticmethod
+    def _expand_jump_path(parent, p, width):
+        """Reconstruct the full cell path from a chain of padded jump points"""
+        jump_points = []
+        while p != -1:
+            jump_points.append(p)
+            p = parent[p]
+        jump_points.reverse()
+
+        path = [jump_points[0]]
+        for p in jump_points[1:]:
+            # Fill in the straight run between consecutive jump points
+            q = path[-1]
+            step = (p - q) // abs(p - q) if abs(p - q) < width else width * ((p > q) - (p < q))
+            while q != p:
+                q += step
+                path.append(q)
+        return [(q // width - 1, q % width - 1) for q in path]
+
+    def search(self, start, goal, collect_states=False):
+        """
+        Run one A* search and bundle everything it produces
+        start: tuple (x, y) or (x, y, z)
+        goal: tuple (x, y) or (x, y, z)
+        collect_states: record an AlgorithmState per step for animation
+        Returns: SearchResult
+
+        Without collect_states this takes the fast find_path_with_stats
+        route and animation_states is left empty.
+        """
+        if not collect_states:
+            path, explored, max_frontier, nodes_evaluated = self.find_path_with_stats(start, goal)
+            return SearchResult(path, explored, [], max_frontier, nodes_evaluated)
+
+        path, animation_states, max_frontier, nodes_evaluated = self.find_path_with_animation_data(start, goal)
+        # Each state holds the cells closed before its step, so the last one
+        # has them all; without a path its own cell was closed afterwards too
+        explored = []
+        if animation_states:
+            last_state = animation_states[-1]
+            explored = list(last_state.explored_nodes)
+            if path is None:
+                explored.append(last_state.current_node)
+        return SearchResult(path, explored, animation_states, max_frontier, nodes_evaluated)
+
     def find_path_with_stats(self, start, goal):
         """
         Find shortest path from start to goal using A* and return statistics
@@ -98,18 +685,24 @@ class AStar:
         goal: tuple (x, y) or (x, y, z)
         Returns: (path, explored_nodes, max_frontier_size, nodes_evaluated)
         """
-        path, _, _, max_frontier_size, nodes_evaluated = self.find_path_with_animation_data(start, goal)
-        # Extract just the explored nodes for backward compatibility
-        explored_nodes = []
-        if path is not None:
-            # Get all explored nodes from animation states
-            astar_temp = AStar(self.grid)
-            _, animation_states, _, _ = astar_temp.find_path_with_animation_data(start, goal)
-            for state in animation_states:
-                explored_nodes.extend(state.explored_nodes)
-            # Remove duplicates while preserving order
-            seen = set()
-            explored_nodes = [x for x in explored_nodes if not (x in seen or seen.add(x))]
+        if self.grid[start] == 1 or self.grid[goal] == 1:
+            return None, [], 0, 0
+
+        start_idx = self._to_index(start)
+        goal_idx = self._to_index(goal)
+
+        # The compiled core tracks the statistics itself
+        if _numba_core() is not None:
+            path_idx, explored_idx, nodes_evaluated, max_frontier_size = self._find_path_numba(
+                start_idx, goal_idx
+            )
+            path = [self._to_coords(idx) for idx in path_idx.tolist()] or None
+            explored_idx = explored_idx.tolist()
+        else:
+            path, explored_idx, nodes_evaluated, max_frontier_size = self._search_core(
+                start_idx, goal_idx, goal
+            )
+        explored_nodes = [self._to_coords(idx) for idx in explored_idx]
         return path, explored_nodes, max_frontier_size, nodes_evaluated
 
     def find_path_with_animation_data(self, start, goal):
@@ -117,35 +710,46 @@ class AStar:
         Find shortest path from start to goal using A* and return animation data
         Returns: (path, animation_states, max_frontier_size, nodes_evaluated)
         """
-        # Create start and goal nodes
-        start_node = Node(*start)
-        goal_node = Node(*goal)
-
         # Check if start and goal are valid
-        if self.is_3d:
-            if (self.grid[start[0]][start[1]][start[2]] == 1 or
-                    self.grid[goal[0]][goal[1]][goal[2]] == 1):
-                return None, [], 0, 0
-        else:
-            if (self.grid[start[0]][start[1]] == 1 or
-                    self.grid[goal[0]][goal[1]] == 1):
-                return None, [], 0, 0
+        if self.grid[start] == 1 or self.grid[goal] == 1:
+            return None, [], 0, 0
+
+        start_idx = self._to_index(start)
+        goal_idx = self._to_index(goal)
+
+        weight = self.heuristic_weight
+        to_coords = self._to_coords
+        is_3d = self.is_3d
+        depth, rows, cols, plane = self.depth, self.rows, self.cols, self._plane
+
+        # Per-cell search state as flat typed arrays indexed by cell; unlike
+        # NumPy arrays, reading one element returns a plain Python number
+        g = array('f', [float('inf')]) * self.N  # Cost from start
+        h = self._heuristic_array(goal)  # Heuristic cost to goal
+        parent = array('i', [-1]) * self.N  # Previous cell on best path
+        state = bytearray(self._wall_state)  # _CLOSED / _IN_OPEN / _WALL flags
 
-        # Initialize start node
-        start_node.g = 0
-        start_node.h = self.heuristic(start_node, goal_node)
-        start_node.f = start_node.g + start_node.h
+        g[start_idx] = 0
 
         # Open set (nodes to be evaluated)
+        # Heap entries are (f, tiebreak, idx, coords); an entry is live only
+        # while its cell is flagged _IN_OPEN and f matches the cell's current
+        # g + w * h, anything else is stale and gets discarded when popped. The
+        # tiebreak counts down so the newest of equal-f entries pops first,
+        # like the bucket queue in find_path, and is unique so coords are
+        # never compared.
+        tiebreak = itertools.count(0, -1)
         open_set = []
-        heapq.heappush(open_set, start_node)
-        open_set_dict = {start: start_node}  # For quick lookup
+        heapq.heappush(open_set, (weight * h[start_idx], next(tiebreak), start_idx, start))
+        state[start_idx] = _IN_OPEN
+        frontier_size = 1  # Number of live cells in the open set
 
-        # Closed set (nodes already evaluated)
-        closed_set = set()
+        explored_nodes = []  # Coordinates of closed cells in closing order
 
-        # Keep track of all nodes
-        all_nodes = {start: start_node}
+        # Frontier changes since the previous state: cells closed, and cells
+        # pushed with their new (g, h, f)
+        frontier_removed = []
+        frontier_added = {start: (g[start_idx], h[start_idx], g[start_idx] + weight * h[start_idx])}
 
         # Animation states
         animation_states = []
@@ -155,63 +759,72 @@ class AStar:
         nodes_evaluated = 0
 
         while open_set:
-            # Capture state BEFORE popping the current node
-            frontier_data = {}
-            for coords, node in open_set_dict.items():
-                if coords not in closed_set:
-                    frontier_data[coords] = (node.g, node.h, node.f)
-
-            # Get the node with lowest f value
-            current = heapq.heappop(open_set)
-            current_coords = current.coords
-            del open_set_dict[current_coords]
+            # Get the cell with lowest f value
+            f, _, idx, current_coords = heapq.heappop(open_set)
+
+            # Skip stale entries superseded by a cheaper push
+            if not state[idx] & _IN_OPEN or f != g[idx] + weight * h[idx]:
+                continue
+
+            frontier_size -= 1
             nodes_evaluated += 1
 
-            # Capture current state with the node about to be evaluated
+            # Capture current state with the node about to be evaluated; the
+            # frontier is recorded as the change since the previous state
             current_state = AlgorithmState(
-                explored_nodes=list(closed_set),
-                frontier=frontier_data.copy(),
+                explored_nodes=PrefixView(explored_nodes, len(explored_nodes)),
+                frontier_added=frontier_added,
+                frontier_removed=frontier_removed,
                 current_node=current_coords
             )
             animation_states.append(current_state)
 
             # Check if we reached the goal
-            if current == goal_node:
-                path = self.reconstruct_path(current)
+            if idx == goal_idx:
+                path = self.reconstruct_path(parent, idx)
                 return path, animation_states, max_frontier_size, nodes_evaluated
 
             # Mark as explored
-            closed_set.add(current_coords)
-
-            # Explore neighbors
-            for neighbor in self.get_neighbors(current):
-                neighbor_tuple = neighbor.coords
-
-                # Skip if already evaluated
-                if neighbor_tuple in closed_set:
+            state[idx] = _CLOSED
+            explored_nodes.append(current_coords)
+            frontier_removed = [current_coords]
+            frontier_added = {}
+
+            # Calculate tentative g score
+            tentative_g = g[idx] + 1  # Cost to move to neighbor is 1
+
+            # Probe the neighbors inline as (index, in bounds), in the same
+            # order get_neighbors yields them
+            if is_3d:
+                x, y, z = current_coords
+                probes = ((idx + plane, x < depth - 1), (idx - plane, x > 0),
+                          (idx + cols, y < rows - 1), (idx - cols, y > 0),
+                          (idx + 1, z < cols - 1), (idx - 1, z > 0))
+            else:
+                x, y = current_coords
+                probes = ((idx + 1, y < cols - 1), (idx + cols, x < rows - 1),
+                          (idx - 1, y > 0), (idx - cols, x > 0))
+
+            for nidx, in_bounds in probes:
+                # Skip walls and cells already evaluated
+                if not in_bounds or state[nidx] & _BLOCKED:
                     continue
 
-                # Calculate tentative g score
-                tentative_g = current.g + 1  # Cost to move to neighbor is 1
-
-                # Get or create neighbor node
-                if neighbor_tuple not in all_nodes:
-                    all_nodes[neighbor_tuple] = neighbor
-                neighbor = all_nodes[neighbor_tuple]
-
                 # Update neighbor if we found a better path
-                if tentative_g < neighbor.g:
-                    neighbor.parent = current
-                    neighbor.g = tentative_g
-                    neighbor.h = self.heuristic(neighbor, goal_node)
-                    neighbor.f = neighbor.g + neighbor.h
-
-                    # Add to open set if not already there
-                    if neighbor_tuple not in open_set_dict:
-                        heapq.heappush(open_set, neighbor)
-                        open_set_dict[neighbor_tuple] = neighbor
+                if tentative_g < g[nidx]:
+                    parent[nidx] = idx
+                    g[nidx] = tentative_g
+                    neighbor = to_coords(nidx)
+
+                    # Push a fresh entry; any older one becomes stale
+                    f = tentative_g + weight * h[nidx]
+                    heapq.heappush(open_set, (f, next(tiebreak), nidx, neighbor))
+                    frontier_added[neighbor] = (g[nidx], h[nidx], f)
+                    if not state[nidx] & _IN_OPEN:
+                        state[nidx] = _IN_OPEN
+                        frontier_size += 1
 
             # Update max frontier size
-            max_frontier_size = max(max_frontier_size, len(open_set))
+            max_frontier_size = max(max_frontier_size, frontier_size)
 
         return None, animation_states, max_frontier_size, nodes_evaluated
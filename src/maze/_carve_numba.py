@@ -0,0 +1,62 @@
+"""
+Numba-compiled maze carving used by MazeGenerator._generate_2d
+
+Importing this module requires numba. Like the pathfinder's compiled
+core it is compiled with cache=True, so only the first run on a machine
+pays the compile time.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def carve_2d(grid, start_x, start_y, seed):
+    """
+    Carve a perfect maze into grid (all walls, 1) by recursive backtracking
+    grid: 2D uint8 array, modified in place
+    seed: seed for numba's random generator, so mazes stay reproducible
+    """
+    np.random.seed(seed)
+    height, width = grid.shape
+
+    # Steps to the cells two away; the wall in between is half a step
+    dx = np.array((0, 2, 0, -2))
+    dy = np.array((2, 0, -2, 0))
+    candidates = np.empty(4, np.int64)
+
+    # Every cell is pushed at most once, as carving it removes its wall
+    stack = np.empty((height * width, 2), np.int32)
+    grid[start_x, start_y] = 0
+    stack[0, 0] = start_x
+    stack[0, 1] = start_y
+    top = 1
+
+    while top > 0:
+        x = stack[top - 1, 0]
+        y = stack[top - 1, 1]
+
+        # Collect the unvisited neighbors (still walls)
+        k = 0
+        for d in range(4):
+            nx = x + dx[d]
+            ny = y + dy[d]
+            if 0 <= nx < height and 0 <= ny < width and grid[nx, ny] == 1:
+                candidates[k] = d
+                k += 1
+
+        if k == 0:
+            # Backtrack
+            top -= 1
+            continue
+
+        # Remove the wall between the current cell and a random neighbor
+        d = candidates[np.random.randint(0, k)]
+        nx = x + dx[d]
+        ny = y + dy[d]
+        grid[x + dx[d] // 2, y + dy[d] // 2] = 0
+        grid[nx, ny] = 0
+
+        stack[top, 0] = nx
+        stack[top, 1] = ny
+        top += 1
@@ -1,7 +1,29 @@
 """Maze generation utilities"""
 
+import importlib.util
 import random
 
+import numpy as np
+
+# numba is optional; with it the 2D carving loop runs compiled
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+
+def _numba_carve():
+    """
+    Import the compiled carving kernel on first use
+    Returns: carve_2d, or None when numba is missing or fails to import,
+    in which case the pure Python carve loop is used from then on
+    """
+    global NUMBA_AVAILABLE
+    if NUMBA_AVAILABLE:
+        try:
+            from ._carve_numba import carve_2d
+            return carve_2d
+        except ImportError:
+            NUMBA_AVAILABLE = False
+    return None
+
 
 class MazeGenerator:
     """Generate random mazes using recursive backtracking (2D) or sparse obstacles (3D)"""
@@ -18,15 +40,25 @@ class MazeGenerator:
         self.depth = depth
         self.is_3d = depth is not None
 
+        # The grid is one C-ordered (row-major) uint8 array indexed [x, y] or
+        # [x, y, z], shaped (height, width) or (depth, height, width): the
+        # last axis (y in 2D, z in 3D) is the fastest varying, so z-runs such
+        # as pillars are contiguous and flat indices are x*plane + y*cols + z,
+        # the layout AStar and the numba kernels assume
         if self.is_3d:
             # Initialize 3D grid with all empty (0s) - we'll add obstacles
-            self.grid = [[[0 for _ in range(width)] for _ in range(height)] for _ in range(depth)]
+            self.grid = np.zeros((depth, height, width), dtype=np.uint8, order='C')
         else:
             # Initialize 2D grid with all walls (1s)
-            self.grid = [[1 for _ in range(width)] for _ in range(height)]
+            self.grid = np.ones((height, width), dtype=np.uint8, order='C')
 
     def generate(self):
-        """Generate a random maze"""
+        """
+        Generate a random maze
+        Returns: the grid as a NumPy uint8 array, 0 = walkable, 1 = obstacle
+        """
+        # Carving works on the flat buffer, which must be in row-major order
+        assert self.grid.flags['C_CONTIGUOUS']
         if self.is_3d:
             return self._generate_3d()
         else:
@@ -38,91 +70,127 @@ class MazeGenerator:
         start_x = random.randint(0, self.height - 1)
         start_y = random.randint(0, self.width - 1)
 
-        # Carve out the starting cell
-        self.grid[start_x][start_y] = 0
+        carve_2d = _numba_carve()
+        if carve_2d is not None:
+            # Seeded from `random` so --seed still gives a reproducible maze,
+            # though not the same one as the pure Python loop below
+            carve_2d(self.grid, start_x, start_y, random.getrandbits(32))
+        else:
+            self._carve_2d(start_x, start_y)
 
-        # Stack for backtracking
-        stack = [(start_x, start_y)]
+        # Ensure start and goal areas are clear
+        self._clear_area_2d(0, 0)
+        self._clear_area_2d(self.height - 1, self.width - 1)
 
-        while stack:
-            current_x, current_y = stack[-1]
+        return self.grid
 
-            # Get unvisited neighbors
-            neighbors = self._get_unvisited_neighbors_2d(current_x, current_y)
+    def _carve_2d(self, start_x, start_y):
+        """Pure Python version of the recursive backtracking carve loop"""
+        height, width = self.height, self.width
+        # Bound once: a local lookup instead of a module attribute per call,
+        # still drawing from the shared generator that --seed seeds
+        rand = random.random
 
-            if neighbors:
-                # Choose a random neighbor
-                next_x, next_y = random.choice(neighbors)
+        # Carve in a flat bytearray (one plain int per read, unlike array
+        # indexing) and copy the result back into the grid at the end
+        cells = bytearray(self.grid.tobytes())
+        step_x = 2 * width
+        step_y = 2
 
-                # Remove wall between current and chosen neighbor
-                wall_x = (current_x + next_x) // 2
-                wall_y = (current_y + next_y) // 2
-                self.grid[wall_x][wall_y] = 0
-                self.grid[next_x][next_y] = 0
+        # Carve out the starting cell
+        start = start_x * width + start_y
+        cells[start] = 0
 
-                # Add neighbor to stack
-                stack.append((next_x, next_y))
-            else:
+        # Stack for backtracking, of (x, y, flat index). A list of tuples is
+        # quicker here than a preallocated typed array with a top index (the
+        # extra per-element stores cost more than the tuples); the numba
+        # kernel is where the fixed int32 stack pays off
+        stack = [(start_x, start_y, start)]
+
+        while stack:
+            x, y, idx = stack[-1]
+
+            # Pick a random unvisited neighbor (still a wall) in one pass:
+            # the k-th candidate replaces the choice with probability 1/k
+            k = 0
+            chosen = None
+            if y + 2 < width and cells[idx + step_y]:
+                k += 1
+                chosen = (x, y + 2, idx + step_y)
+            if x + 2 < height and cells[idx + step_x]:
+                k += 1
+                if rand() * k < 1:
+                    chosen = (x + 2, y, idx + step_x)
+            if y >= 2 and cells[idx - step_y]:
+                k += 1
+                if rand() * k < 1:
+                    chosen = (x, y - 2, idx - step_y)
+            if x >= 2 and cells[idx - step_x]:
+                k += 1
+                if rand() * k < 1:
+                    chosen = (x - 2, y, idx - step_x)
+
+            if chosen is None:
                 # Backtrack
                 stack.pop()
+                continue
 
-        # Ensure start and goal areas are clear
-        self._clear_area_2d(0, 0)
-        self._clear_area_2d(self.height - 1, self.width - 1)
+            # Remove wall between current and chosen neighbor
+            next_idx = chosen[2]
+            cells[(idx + next_idx) // 2] = 0
+            cells[next_idx] = 0
 
-        return self.grid
+            # Add neighbor to stack
+            stack.append(chosen)
+
+        self.grid[...] = np.frombuffer(cells, dtype=np.uint8).reshape(self.grid.shape)
 
     def _generate_3d(self):
         """Generate a simple 3D maze with sparse obstacles"""
         # Start with all empty space (done in __init__)
 
+        # Bound once, still drawing from the shared generator --seed seeds
+        randint, choice, rand = random.randint, random.choice, random.random
+
         # Add some pillar obstacles (vertical columns)
         num_pillars = min(8, (self.height * self.width) // 20)
         for _ in range(num_pillars):
-            x = random.randint(2, self.depth - 3)
-            y = random.randint(2, self.height - 3)
+            x = randint(2, self.depth - 3)
+            y = randint(2, self.height - 3)
             # Create a pillar through multiple z levels
-            pillar_height = random.randint(3, min(7, self.width - 2))
-            start_z = random.randint(0, self.width - pillar_height)
-            for z in range(start_z, start_z + pillar_height):
-                self.grid[x][y][z] = 1
+            pillar_height = randint(3, min(7, self.width - 2))
+            start_z = randint(0, self.width - pillar_height)
+            self.grid[x, y, start_z:start_z + pillar_height] = 1
 
         # Add some floating blocks
         num_blocks = min(10, (self.depth * self.height * self.width) // 100)
         for _ in range(num_blocks):
-            x = random.randint(1, self.depth - 2)
-            y = random.randint(1, self.height - 2)
-            z = random.randint(1, self.width - 2)
-            # Create a small 2x2x2 or 3x3x3 block
-            block_size = random.choice([2, 3])
-            for dx in range(block_size):
-                for dy in range(block_size):
-                    for dz in range(block_size):
-                        nx, ny, nz = x + dx, y + dy, z + dz
-                        if (0 < nx < self.depth - 1 and
-                                0 < ny < self.height - 1 and
-                                0 < nz < self.width - 1):
-                            self.grid[nx][ny][nz] = 1
+            x = randint(1, self.depth - 2)
+            y = randint(1, self.height - 2)
+            z = randint(1, self.width - 2)
+            # Create a small 2x2x2 or 3x3x3 block, clipped to the interior
+            block_size = choice([2, 3])
+            self.grid[x:min(x + block_size, self.depth - 1),
+                      y:min(y + block_size, self.height - 1),
+                      z:min(z + block_size, self.width - 1)] = 1
 
         # Add some wall segments
         num_walls = min(6, (self.height + self.width) // 4)
         for _ in range(num_walls):
-            if random.random() < 0.5:
+            if rand() < 0.5:
                 # Horizontal wall (along x)
-                y = random.randint(1, self.height - 2)
-                z = random.randint(1, self.width - 2)
-                length = random.randint(3, self.depth // 2)
-                start_x = random.randint(0, self.depth - length)
-                for x in range(start_x, start_x + length):
-                    self.grid[x][y][z] = 1
+                y = randint(1, self.height - 2)
+                z = randint(1, self.width - 2)
+                length = randint(3, self.depth // 2)
+                start_x = randint(0, self.depth - length)
+                self.grid[start_x:start_x + length, y, z] = 1
             else:
                 # Horizontal wall (along y)
-                x = random.randint(1, self.depth - 2)
-                z = random.randint(1, self.width - 2)
-                length = random.randint(3, self.height // 2)
-                start_y = random.randint(0, self.height - length)
-                for y in range(start_y, start_y + length):
-                    self.grid[x][y][z] = 1
+                x = randint(1, self.depth - 2)
+                z = randint(1, self.width - 2)
+                length = randint(3, self.height // 2)
+                start_y = randint(0, self.height - length)
+                self.grid[x, start_y:start_y + length, z] = 1
 
         # Ensure start and goal areas are clear
         self._clear_area_3d(0, 0, 0, radius=1)
@@ -130,56 +198,32 @@ class MazeGenerator:
 
         return self.grid
 
-    def _get_unvisited_neighbors_2d(self, x, y):
-        """Get unvisited neighbors that are 2 cells away"""
-        neighbors = []
-        directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
-
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-
-            # Check if neighbor is within bounds and unvisited (still a wall)
-            if 0 <= nx < self.height and 0 <= ny < self.width and self.grid[nx][ny] == 1:
-                neighbors.append((nx, ny))
-
-        return neighbors
-
     def _clear_area_2d(self, x, y, radius=1):
         """Clear a small area around a point in 2D"""
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.height and 0 <= ny < self.width:
-                    self.grid[nx][ny] = 0
+        # Slices clip at the far edge; only the near edge needs clamping
+        self.grid[max(0, x - radius):x + radius + 1,
+                  max(0, y - radius):y + radius + 1] = 0
 
     def _clear_area_3d(self, x, y, z, radius=1):
         """Clear a small area around a point in 3D"""
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                for dz in range(-radius, radius + 1):
-                    nx, ny, nz = x + dx, y + dy, z + dz
-                    if (0 <= nx < self.depth and
-                            0 <= ny < self.height and
-                            0 <= nz < self.width):
-                        self.grid[nx][ny][nz] = 0
+        # Slices clip at the far edge; only the near edge needs clamping
+        self.grid[max(0, x - radius):x + radius + 1,
+                  max(0, y - radius):y + radius + 1,
+                  max(0, z - radius):z + radius + 1] = 0
 
     def add_random_paths(self, percentage=0.1):
-        """Add some random paths to make the maze less perfect"""
-        if self.is_3d:
-            cells_to_clear = int(self.depth * self.height * self.width * percentage)
-
-            for _ in range(cells_to_clear):
-                x = random.randint(1, self.depth - 2)
-                y = random.randint(1, self.height - 2)
-                z = random.randint(1, self.width - 2)
-                self.grid[x][y][z] = 0
-        else:
-            cells_to_clear = int(self.height * self.width * percentage)
-
-            for _ in range(cells_to_clear):
-                x = random.randint(1, self.height - 2)
-                y = random.randint(1, self.width - 2)
-                self.grid[x][y] = 0
+        """
+        Add some random paths to make the maze less perfect
+        percentage: probability (0.0-1.0) that each interior wall is removed
+        """
+        # Seed NumPy from `random` so mazes stay reproducible with --seed
+        rng = np.random.default_rng(random.getrandbits(64))
+
+        # Only the interior is opened up; the outer border is left alone
+        interior = self.grid[(slice(1, -1),) * self.grid.ndim]
+        if interior.size == 0:
+            return
+        interior[(rng.random(interior.shape) < percentage) & (interior == 1)] = 0
 
     @staticmethod
     def create_sample_maze():
@@ -1,18 +1,25 @@
 """Visualization utilities for pathfinding"""
 
+import numpy as np
+
 # Try to import matplotlib
 try:
     import matplotlib.pyplot as plt
     import matplotlib.patches as patches
     from matplotlib.animation import FuncAnimation
+    from matplotlib.colors import ListedColormap
     from mpl_toolkits.mplot3d import Axes3D
     from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-    import numpy as np
 
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
     MATPLOTLIB_AVAILABLE = False
 
+# Console symbol for each cell value: 0 walkable '.', 1 obstacle '#',
+# 2 path '*', 3 start 'S', 4 goal 'G' and '?' for anything else
+_SYMBOLS = np.full(256, ord('?'), dtype=np.uint8)
+_SYMBOLS[:5] = np.frombuffer(b'.#*SG', dtype=np.uint8)
+
 
 class ConsoleVisualizer:
     """Text-based visualization for grids and paths"""
@@ -20,68 +27,45 @@ class ConsoleVisualizer:
     @staticmethod
     def visualize_path(grid, path, start, goal):
         """Visualize the grid and path in console"""
-        # For 3D grids, show layer by layer
-        if isinstance(grid[0][0], list):  # 3D grid
-            depth = len(grid)
-            for z in range(depth):
-                print(f"\nLayer {z}:")
-                # Create a 2D slice
-                layer = grid[z]
-                visual = [row[:] for row in layer]
-
-                # Mark the path in this layer
-                if path:
-                    for coords in path:
-                        if len(coords) == 3 and coords[0] == z:
-                            x, y, z_coord = coords
-                            if coords != start and coords != goal:
-                                visual[y][z_coord] = 2  # Path marker
-
-                # Mark start and goal if in this layer
-                if len(start) == 3 and start[0] == z:
-                    visual[start[1]][start[2]] = 3  # Start marker
-                if len(goal) == 3 and goal[0] == z:
-                    visual[goal[1]][goal[2]] = 4  # Goal marker
-
-                # Print the layer
-                symbols = {
-                    0: '.',  # Walkable
-                    1: '#',  # Obstacle
-                    2: '*',  # Path
-                    3: 'S',  # Start
-                    4: 'G'  # Goal
-                }
-
-                for row in visual:
-                    print(' '.join(symbols.get(cell, '?') for cell in row))
-        else:
-            # 2D visualization (existing code)
-            visual = [row[:] for row in grid]
+        # Mark the path on one contiguous copy, never on the caller's grid
+        cells = np.array(grid, dtype=np.uint8)
+        is_3d = cells.ndim == 3
 
-            # Mark the path
-            if path:
-                for coords in path:
-                    if len(coords) == 2:  # 2D
-                        x, y = coords
-                        if (x, y) != start and (x, y) != goal:
-                            visual[x][y] = 2  # Path marker
+        # Mark the path, branching on dimension once rather than per cell
+        if path:
+            if is_3d:
+                for x, y, z in path:
+                    if (x, y, z) != start and (x, y, z) != goal:
+                        cells[x, y, z] = 2  # Path marker
+            else:
+                for x, y in path:
+                    if (x, y) != start and (x, y) != goal:
+                        cells[x, y] = 2  # Path marker
 
-            # Mark start and goal for 2D
-            if len(start) == 2:
-                visual[start[0]][start[1]] = 3  # Start marker
-                visual[goal[0]][goal[1]] = 4  # Goal marker
+        # Mark start and goal
+        if len(start) == cells.ndim:
+            cells[tuple(start)] = 3  # Start marker
+            cells[tuple(goal)] = 4  # Goal marker
 
+        # For 3D grids, show layer by layer
+        if is_3d:
+            for z in range(len(cells)):
+                print(f"\nLayer {z}:")
+                ConsoleVisualizer._print_cells(cells[z])
+        else:
             # Print the grid
-            symbols = {
-                0: '.',  # Walkable
-                1: '#',  # Obstacle
-                2: '*',  # Path
-                3: 'S',  # Start
-                4: 'G'  # Goal
-            }
+            ConsoleVisualizer._print_cells(cells)
 
-            for row in visual:
-                print(' '.join(symbols.get(cell, '?') for cell in row))
+    @staticmethod
+    def _print_cells(visual):
+        """Print a 2D grid of cell values, one space-separated row per line"""
+        height, width = visual.shape
+
+        # Translate every cell in one lookup into a buffer of "c c c\n" rows
+        text = np.full((height, 2 * width), ord(' '), dtype=np.uint8)
+        text[:, ::2] = _SYMBOLS[visual]
+        text[:, -1] = ord('\n')
+        print(text.tobytes().decode('ascii'), end='')
 
 
 class MatplotlibVisualizer:
@@ -100,7 +84,7 @@ class MatplotlibVisualizer:
             return
 
         # Check if 3D
-        if isinstance(grid[0][0], list):
+        if np.ndim(grid) == 3:
             # For now, just show a message
             print("Static 3D visualization not implemented. Use animated mode.")
             return
@@ -112,9 +96,6 @@ class MatplotlibVisualizer:
         # Create figure with proper size
         fig, ax = plt.subplots(figsize=(10, 7))
 
-        # Create display array
-        display = np.ones((height, width, 3))  # RGB array
-
         # Define colors (RGB)
         colors = {
             'wall': [0.2, 0.2, 0.2],  # Dark gray
@@ -125,33 +106,25 @@ class MatplotlibVisualizer:
             'goal': [0.5, 0.2, 0.8]  # Purple
         }
 
-        # Fill maze structure
-        for i in range(height):
-            for j in range(width):
-                if maze[i][j] == 1:  # Wall
-                    display[i, j] = colors['wall']
-                else:  # Empty
-                    display[i, j] = colors['empty']
-
-        # Mark explored nodes
-        for coords in explored_nodes:
-            x, y = coords[:2]  # Handle both 2D and 3D
-            if (x, y) != start[:2] and (x, y) != goal[:2]:
-                display[x, y] = colors['explored']
-
-        # Mark path
-        if path:
-            for coords in path:
-                x, y = coords[:2]  # Handle both 2D and 3D
-                if (x, y) != start[:2] and (x, y) != goal[:2]:
-                    display[x, y] = colors['path']
+        # One byte label per cell, coloured by a colormap in this order
+        order = ('empty', 'wall', 'explored', 'path', 'start', 'goal')
+        cmap = ListedColormap([colors[name] for name in order])
+        labels = (maze == 1).astype(np.uint8)  # 0 = empty, 1 = wall
+
+        # Mark explored nodes, then the path over them; start and goal are
+        # labelled last, so they need no exclusion here
+        for cells, label in ((explored_nodes, 2), (path, 3)):
+            if cells:
+                xy = np.asarray(cells)[:, :2]  # Handle both 2D and 3D
+                labels[xy[:, 0], xy[:, 1]] = label
 
         # Mark start and goal
-        display[start[0], start[1]] = colors['start']
-        display[goal[0], goal[1]] = colors['goal']
+        labels[start[0], start[1]] = 4
+        labels[goal[0], goal[1]] = 5
 
-        # Display the image
-        ax.imshow(display, interpolation='nearest', aspect='equal')
+        # Display the image, centring each label in its colormap bin
+        ax.imshow(labels, cmap=cmap, vmin=-0.5, vmax=len(order) - 0.5,
+                  interpolation='nearest', aspect='equal')
 
         # Remove axes
         ax.axis('off')
@@ -203,7 +176,7 @@ class MatplotlibVisualizer:
             return
 
         # Check if 3D
-        if isinstance(grid[0][0], list):
+        if np.ndim(grid) == 3:
             MatplotlibVisualizer._plot_solution_3d_animated(
                 grid, path, animation_states, start, goal, stats,
                 interval, learning_mode, save_path
@@ -218,8 +191,8 @@ class MatplotlibVisualizer:
     def _plot_solution_2d_animated(grid, path, animation_states, start, goal, stats,
                                    interval=50, learning_mode=False, save_path=None):
         """2D animated visualization (existing code)"""
-        # Import AlgorithmState if using animation states
-        from src.core.node import AlgorithmState
+        # States only record frontier changes; replay them into full frontiers
+        from src.core.node import replay_frontier
 
         # Convert grid to numpy array
         maze = np.array(grid)
@@ -228,9 +201,6 @@ class MatplotlibVisualizer:
         # Create figure with proper size
         fig, ax = plt.subplots(figsize=(12, 8))
 
-        # Create base display array
-        display = np.ones((height, width, 3))  # RGB array
-
         # Define colors (RGB)
         colors = {
             'wall': [0.2, 0.2, 0.2],  # Dark gray
@@ -243,13 +213,10 @@ class MatplotlibVisualizer:
             'goal': [0.5, 0.2, 0.8]  # Purple
         }
 
-        # Fill initial maze structure
-        for i in range(height):
-            for j in range(width):
-                if maze[i][j] == 1:  # Wall
-                    display[i, j] = colors['wall']
-                else:  # Empty
-                    display[i, j] = colors['empty']
+        # Fill initial maze structure with one palette lookup: 0 = empty, 1 = wall
+        palette = np.array([colors['empty'], colors['wall']])
+        base = palette[(maze == 1).astype(np.intp)]
+        display = base.copy()  # RGB array
 
         # Mark start and goal
         display[start[0], start[1]] = colors['start']
@@ -296,12 +263,14 @@ class MatplotlibVisualizer:
         # Animation state
         current_step = 0
         exploration_done = False
+        frontiers = replay_frontier(animation_states)
+        frontier = {}  # Full frontier of the current step
 
         def update_stats_text(state_idx):
             """Update the statistics text"""
             if state_idx < len(animation_states):
                 explored_count = len(animation_states[state_idx].explored_nodes)
-                frontier_size = len(animation_states[state_idx].frontier)
+                frontier_size = len(frontier)
             else:
                 explored_count = len(animation_states[-1].explored_nodes) if animation_states else 0
                 frontier_size = 0
@@ -315,36 +284,36 @@ class MatplotlibVisualizer:
             text += f"Efficiency: {efficiency_str}"
             stats_text.set_text(text)
 
+        # Start and goal cells, sliced once instead of per marked cell
+        start_xy = tuple(start[:2])
+        goal_xy = tuple(goal[:2])
+
         def animate(frame):
             """Animation function"""
-            nonlocal current_step, exploration_done, display
+            nonlocal current_step, exploration_done, display, frontier
 
             # Phase 1: Exploration
             if current_step < len(animation_states):
                 state = animation_states[current_step]
+                frontier = next(frontiers)
 
                 # Always reset display to base state (for frontier visualization)
-                for i in range(height):
-                    for j in range(width):
-                        if maze[i][j] == 1:  # Wall
-                            display[i, j] = colors['wall']
-                        else:  # Empty
-                            display[i, j] = colors['empty']
+                display[:] = base
 
                 # Mark explored nodes
                 for coords in state.explored_nodes:
                     x, y = coords[:2]
-                    if (x, y) != start[:2] and (x, y) != goal[:2]:
+                    if (x, y) != start_xy and (x, y) != goal_xy:
                         display[x, y] = colors['explored']
 
                 # ALWAYS mark frontier nodes (not just in learning mode)
-                for coords in state.frontier.keys():
+                for coords in frontier.keys():
                     x, y = coords[:2]
-                    if (x, y) != start[:2] and (x, y) != goal[:2]:
+                    if (x, y) != start_xy and (x, y) != goal_xy:
                         display[x, y] = colors['frontier']
 
                 # Mark current node
-                if state.current_node and state.current_node[:2] != start[:2] and state.current_node[:2] != goal[:2]:
+                if state.current_node and state.current_node[:2] != start_xy and state.current_node[:2] != goal_xy:
                     display[state.current_node[0], state.current_node[1]] = colors['current']
 
                 # Handle text annotations only in learning mode
@@ -355,7 +324,7 @@ class MatplotlibVisualizer:
                     cell_texts.clear()
 
                     # Add text for frontier nodes showing g and h values
-                    for coords, (g, h, f) in state.frontier.items():
+                    for coords, (g, h, f) in frontier.items():
                         x, y = coords[:2]
                         text = ax.text(y, x, f'{int(g)}\n{int(h)}',
                                        ha='center', va='center', fontsize=8,
@@ -383,7 +352,7 @@ class MatplotlibVisualizer:
                 # Draw the final path
                 for coords in path:
                     x, y = coords[:2]
-                    if (x, y) != start[:2] and (x, y) != goal[:2]:
+                    if (x, y) != start_xy and (x, y) != goal_xy:
                         display[x, y] = colors['path']
 
                 # Update final statistics
@@ -424,8 +393,8 @@ class MatplotlibVisualizer:
     def _plot_solution_3d_animated(grid, path, animation_states, start, goal, stats,
                                    interval=50, learning_mode=False, save_path=None):
         """Create an animated 3D plot"""
-        # Import AlgorithmState
-        from src.core.node import AlgorithmState
+        # States only record frontier changes; replay them into full frontiers
+        from src.core.node import replay_frontier
 
         # Convert grid to numpy array
         maze = np.array(grid)
@@ -455,6 +424,8 @@ class MatplotlibVisualizer:
         # Animation state
         current_step = 0
         exploration_done = False
+        frontiers = replay_frontier(animation_states)
+        frontier = {}  # Full frontier of the current step
 
         # Store collections
         wall_collections = []  # Persistent walls
@@ -506,7 +477,7 @@ class MatplotlibVisualizer:
             """Update the statistics text in title"""
             if state_idx < len(animation_states):
                 explored_count = len(animation_states[state_idx].explored_nodes)
-                frontier_size = len(animation_states[state_idx].frontier)
+                frontier_size = len(frontier)
             else:
                 explored_count = len(animation_states[-1].explored_nodes) if animation_states else 0
                 frontier_size = 0
@@ -527,7 +498,7 @@ class MatplotlibVisualizer:
 
         def animate(frame):
             """Animation function"""
-            nonlocal current_step, exploration_done
+            nonlocal current_step, exploration_done, frontier
 
             # Clear only dynamic elements (not walls)
             for coll in dynamic_collections:
@@ -541,6 +512,7 @@ class MatplotlibVisualizer:
             # Phase 1: Exploration
             if current_step < len(animation_states):
                 state = animation_states[current_step]
+                frontier = next(frontiers)
 
                 # Draw explored nodes
                 for x, y, z in state.explored_nodes:
@@ -550,7 +522,7 @@ class MatplotlibVisualizer:
                         dynamic_collections.append(poly)
 
                 # Draw frontier nodes
-                for (x, y, z), (g, h, f) in state.frontier.items():
+                for (x, y, z), (g, h, f) in frontier.items():
                     if (x, y, z) != start and (x, y, z) != goal:
                         poly = draw_voxel(x, y, z, colors['frontier'], size=0.85)
                         ax.add_collection3d(poly)